@@ -6,6 +6,16 @@ from six import string_types
 from xarray import Dataset
 
 
+def _forward_fill_index(is_valid):
+    """Get the index of the last valid value at or before each position.
+
+    *is_valid* is flattened in row-major order. Positions that are not
+    preceded by any valid value are given an index of -1.
+    """
+    index = np.where(is_valid.ravel(), np.arange(is_valid.size), -1)
+    return np.maximum.accumulate(index)
+
+
 class DataRecord(Dataset):
     """Data structure to store variables in time and/or space dimensions.
 
@@ -338,19 +348,15 @@ class DataRecord(Dataset):
         """Check that element_id values are valid."""
         for at in self.permitted_locations:
             max_size = self._grid[at].size
-            selected_elements_ind = [
-                i for i in range(len(grid_element)) if grid_element[i] == at
-            ]
-            selected_elements = element_id[selected_elements_ind]
+            selected_elements = element_id[np.asarray(grid_element) == at]
 
             if selected_elements.size > 0:
-                if max(selected_elements) >= max_size:
+                if selected_elements.max() >= max_size:
                     raise ValueError(
                         "An item residing at " + at + " has an "
                         "element_id larger than the number of " + at + " on the grid"
                     )
-                less_than_zero = selected_elements < 0
-                if any(less_than_zero):
+                if np.any(selected_elements < 0):
                     raise ValueError(
                         "An item residing at " + at + " has "
                         "an element id below zero. This is not "
@@ -785,8 +791,9 @@ class DataRecord(Dataset):
             except TypeError:
                 raise TypeError("time must be a list or a 1-D array")
             try:
-                time_index = int(self.time_coordinates.index(time[0]))
-            except ValueError:
+                # check that time coordinate already exists
+                time_index = int(np.where(self.time.values == time[0])[0][0])
+            except IndexError:
                 raise IndexError(
                     "The time you passed is not currently"
                     " in the DataRecord, you must change the value"
@@ -1091,34 +1098,25 @@ class DataRecord(Dataset):
         """
 
         # Forward fill element_id:
-        fill_value = []
         ei = self["element_id"].values
-        for i in range(ei.shape[0]):
-            for j in range(ei.shape[1]):
-                if np.isnan(ei[i, j]):
-                    ei[i, j] = fill_value
-                else:
-                    fill_value = ei[i, j]
+        fill_index = _forward_fill_index(~np.isnan(ei))
+        ei = ei.ravel()[np.maximum(fill_index, 0)].reshape(ei.shape)
         self["element_id"] = (["item_id", "time"], ei)
         # Can't do ffill to grid_element because str/nan, so:
-        fill_value = ""
         ge = self["grid_element"].values
-        for i in range(ge.shape[0]):
-            for j in range(ge.shape[1]):
-                if isinstance(ge[i, j], str):
-                    fill_value = ge[i, j]
-                else:
-                    ge[i, j] = fill_value
+        fill_index = _forward_fill_index(
+            np.array([isinstance(loc, str) for loc in ge.flat], dtype=bool)
+        )
+        ge = np.where(
+            fill_index >= 0, ge.ravel()[np.maximum(fill_index, 0)], ""
+        ).reshape(ge.shape)
         self["grid_element"] = (["item_id", "time"], ge)
 
     @property
     def variable_names(self):
         """Return the name(s) of the data variable(s) in the record as a list.
         """
-        _keys = []
-        for key in self.to_dataframe().keys():
-            _keys.append(key)
-        return _keys
+        return list(self.data_vars)
 
     @property
     def number_of_items(self):
@@ -1148,19 +1146,21 @@ class DataRecord(Dataset):
     def earliest_time(self):
         """Return the earliest time coordinate in the DataRecord.
         """
-        return min(self.time.values)
+        return self.time.values.min()
 
     @property
     def latest_time(self):
         """Return the latest time coordinate in the DataRecord.
         """
-        return max(self.time.values)
+        return self.time.values.max()
 
     @property
     def prior_time(self):
         """Return the penultimate time coordinate in the DataRecord.
         """
-        if self.number_of_timesteps < 2:
+        times = self.time.values
+        if times.size < 2:
             return np.nan
         else:
-            return sorted(self.time_coordinates)[-2]
+            # partial sort: only the two largest times need to be ordered
+            return np.partition(times, -2)[-2]
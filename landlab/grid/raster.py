@@ -4150,52 +4150,46 @@ class RasterModelGrid(DiagonalsMixIn, ModelGrid, RasterModelGridPlotter):
             ), "Method must be either 'D8'(default) or 'D4'"
 
         # begin main code portion.
-        # initialize list of core nodes and new nodes
-        connected_nodes = list(outlet_id)
-        newNodes = connected_nodes
-
-        # keep track of the number of nodes added in the previous itteration.
-        numAdded = len(newNodes)
+        # keep track of the nodes already known to be connected to the outlet
+        # so that each search front only has to be checked against this mask.
+        is_connected = np.zeros(self.number_of_nodes, dtype=bool)
+        newNodes = np.asarray(outlet_id).reshape((-1,))
+        is_connected[newNodes] = True
 
         # continue running until no new nodes are added.
-        while numAdded > 0:
+        while newNodes.size > 0:
 
             # find all potential new nodes by filtering the nodes connected to
             # the most recent set of new nodes based on their status.
             connected_orthogonal_nodes = self.adjacent_nodes_at_node[newNodes]
-            potentialNewNodes = list(
-                connected_orthogonal_nodes[
-                    self.status_at_node[connected_orthogonal_nodes] != CLOSED_BOUNDARY
-                ]
-            )
+            potentialNewNodes = connected_orthogonal_nodes[
+                self.status_at_node[connected_orthogonal_nodes] != CLOSED_BOUNDARY
+            ]
 
             # if method is D8 (default), add the diagonal nodes.
             if adjacency_method == "D8":
                 connected_diagonal_nodes = self.diagonal_adjacent_nodes_at_node[
                     newNodes
                 ]
-                potentialNewNodes.extend(
-                    connected_diagonal_nodes[
-                        self.status_at_node[connected_diagonal_nodes] != CLOSED_BOUNDARY
-                    ]
+                potentialNewNodes = np.concatenate(
+                    (
+                        potentialNewNodes,
+                        connected_diagonal_nodes[
+                            self.status_at_node[connected_diagonal_nodes]
+                            != CLOSED_BOUNDARY
+                        ],
+                    )
                 )
 
-            # filter new nodes further based on if they are already present in
-            # the connected node list
-            newNodes = list(set(potentialNewNodes) - set(connected_nodes))
-            connected_nodes.extend(newNodes)
-
-            # update number added, when this is zero, the loop will end
-            numAdded = len(newNodes)
-
-        # create an array that identifies the nodes that should be closed
-        # of closed boundary nodes
-        not_connected = np.array((0 * self.status_at_node) + 1)
-        not_connected[np.array(connected_nodes)] = 0
+            # filter new nodes further based on if they are already known to
+            # be connected
+            newNodes = np.unique(potentialNewNodes)
+            newNodes = newNodes[~is_connected[newNodes]]
+            is_connected[newNodes] = True
 
         # identify those nodes that should be closed, but are not yet closed.
         is_not_connected_to_outlet = (self.status_at_node != CLOSED_BOUNDARY) & (
-            not_connected == 1
+            ~is_connected
         )
 
         # modify the node_data array to set those that are disconnected
@@ -371,10 +371,9 @@ class VoronoiDelaunayGrid(ModelGrid):
         # The ConvexHull object lists the edges that form the hull. We need to
         # get from this list of edges the unique set of nodes. To do this, we
         # first flatten the list of vertices that make up all the hull edges
-        # ("simplices"), so it becomes a 1D array. With that, we can use the
-        # set() function to turn the array into a set, which removes duplicate
-        # vertices. Then we turn it back into an array, which now contains the
-        # set of IDs for the nodes that make up the convex hull.
+        # ("simplices"), so it becomes a 1D array. With that, we can use
+        # np.unique() to remove duplicate vertices, which leaves a sorted
+        # array of the IDs for the nodes that make up the convex hull.
         #   The next thing to worry about is the fact that the mesh perimeter
         # might contain nodes that are co-planar (that is, co-linear in our 2D
         # world). For example, if you make a set of staggered points for a
@@ -385,7 +384,7 @@ class VoronoiDelaunayGrid(ModelGrid):
         # the list of boundary_nodes. To deal with this, we pass the 'Qt'
         # option to ConvexHull, which makes it generate a list of coplanar
         # points. We include these in our set of boundary nodes.
-        convex_hull_nodes = np.array(list(set(hull.simplices.flatten())))
+        convex_hull_nodes = np.unique(hull.simplices)
         coplanar_nodes = hull.coplanar[:, 0]
         boundary_nodes = as_id_array(
             np.concatenate((convex_hull_nodes, coplanar_nodes))